@@ -1,6 +1,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Literal, Optional, Union
+from urllib.parse import quote
 
 import httpx
 from pydantic import BaseModel, model_validator
@@ -611,30 +612,12 @@ class Account(TastytradeJsonDataclass):
             "snapshot-date": snapshot_date,
             "time-of-day": time_of_day,
         }
-        snapshots = []
-        while True:
-            response = await session.async_client.get(
-                f"/accounts/{self.account_number}/balance-snapshots",
-                params={
-                    k: v  # type: ignore
-                    for k, v in params.items()
-                    if v is not None
-                },
-            )
-            validate_response(response)
-            json = response.json()
-            snapshots.extend(
-                [AccountBalanceSnapshot(**i) for i in json["data"]["items"]]
-            )
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-        return snapshots
+        return await session._a_get_pages(
+            AccountBalanceSnapshot,
+            f"/accounts/{self.account_number}/balance-snapshots",
+            params,
+            paginate,
+        )
 
     def get_balance_snapshots(
         self,
@@ -674,30 +657,12 @@ class Account(TastytradeJsonDataclass):
             "snapshot-date": snapshot_date,
             "time-of-day": time_of_day,
         }
-        snapshots = []
-        while True:
-            response = session.sync_client.get(
-                f"/accounts/{self.account_number}/balance-snapshots",
-                params={
-                    k: v  # type: ignore
-                    for k, v in params.items()
-                    if v is not None
-                },
-            )
-            validate_response(response)
-            json = response.json()
-            snapshots.extend(
-                [AccountBalanceSnapshot(**i) for i in json["data"]["items"]]
-            )
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-        return snapshots
+        return session._get_pages(
+            AccountBalanceSnapshot,
+            f"/accounts/{self.account_number}/balance-snapshots",
+            params,
+            paginate,
+        )
 
     async def a_get_positions(
         self,
@@ -742,7 +707,7 @@ class Account(TastytradeJsonDataclass):
             f"/accounts/{self.account_number}/positions",
             params={k: v for k, v in params.items() if v is not None},
         )
-        return [CurrentPosition(**i) for i in data["items"]]
+        return CurrentPosition._validate_list(data["items"])
 
     def get_positions(
         self,
@@ -787,7 +752,7 @@ class Account(TastytradeJsonDataclass):
             f"/accounts/{self.account_number}/positions",
             params={k: v for k, v in params.items() if v is not None},
         )
-        return [CurrentPosition(**i) for i in data["items"]]
+        return CurrentPosition._validate_list(data["items"])
 
     async def a_get_history(
         self,
@@ -859,30 +824,12 @@ class Account(TastytradeJsonDataclass):
             "start-at": start_at,
             "end-at": end_at,
         }
-        # loop through pages and get all transactions
-        txns = []
-        while True:
-            response = await session.async_client.get(
-                f"/accounts/{self.account_number}/transactions",
-                params={
-                    k: v  # type: ignore
-                    for k, v in params.items()
-                    if v is not None
-                },
-            )
-            validate_response(response)
-            json = response.json()
-            txns.extend([Transaction(**i) for i in json["data"]["items"]])
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-
-        return txns
+        return await session._a_get_pages(
+            Transaction,
+            f"/accounts/{self.account_number}/transactions",
+            params,
+            paginate,
+        )
 
     def get_history(
         self,
@@ -954,30 +901,12 @@ class Account(TastytradeJsonDataclass):
             "start-at": start_at,
             "end-at": end_at,
         }
-        # loop through pages and get all transactions
-        txns = []
-        while True:
-            response = session.sync_client.get(
-                f"/accounts/{self.account_number}/transactions",
-                params={
-                    k: v  # type: ignore
-                    for k, v in params.items()
-                    if v is not None
-                },
-            )
-            validate_response(response)
-            json = response.json()
-            txns.extend([Transaction(**i) for i in json["data"]["items"]])
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-
-        return txns
+        return session._get_pages(
+            Transaction,
+            f"/accounts/{self.account_number}/transactions",
+            params,
+            paginate,
+        )
 
     async def a_get_transaction(self, session: Session, id: int) -> Transaction:
         """
@@ -1065,7 +994,7 @@ class Account(TastytradeJsonDataclass):
         data = await session._a_get(
             f"/accounts/{self.account_number}/net-liq/history", params=params
         )
-        return [NetLiqOhlc(**i) for i in data["items"]]
+        return NetLiqOhlc._validate_list(data["items"])
 
     def get_net_liquidating_value_history(
         self,
@@ -1099,7 +1028,7 @@ class Account(TastytradeJsonDataclass):
         data = session._get(
             f"/accounts/{self.account_number}/net-liq/history", params=params
         )
-        return [NetLiqOhlc(**i) for i in data["items"]]
+        return NetLiqOhlc._validate_list(data["items"])
 
     async def a_get_position_limit(self, session: Session) -> PositionLimit:
         """
@@ -1130,7 +1059,7 @@ class Account(TastytradeJsonDataclass):
         :param symbol: the symbol to get margin requirements for.
         """
         if symbol:
-            symbol = symbol.replace("/", "%2F")
+            symbol = quote(symbol, safe="")
         data = await session._a_get(
             f"/accounts/{self.account_number}/margin-"
             f"requirements/{symbol}/effective"
@@ -1148,7 +1077,7 @@ class Account(TastytradeJsonDataclass):
         :param symbol: the symbol to get margin requirements for.
         """
         if symbol:
-            symbol = symbol.replace("/", "%2F")
+            symbol = quote(symbol, safe="")
         data = session._get(
             f"/accounts/{self.account_number}/margin-"
             f"requirements/{symbol}/effective"
@@ -1184,7 +1113,7 @@ class Account(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         """
         data = await session._a_get(f"/accounts/{self.account_number}/orders/live")
-        return [PlacedOrder(**i) for i in data["items"]]
+        return PlacedOrder._validate_list(data["items"])
 
     def get_live_orders(self, session: Session) -> list[PlacedOrder]:
         """
@@ -1193,7 +1122,7 @@ class Account(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         """
         data = session._get(f"/accounts/{self.account_number}/orders/live")
-        return [PlacedOrder(**i) for i in data["items"]]
+        return PlacedOrder._validate_list(data["items"])
 
     async def a_get_live_complex_orders(
         self, session: Session
@@ -1206,7 +1135,7 @@ class Account(TastytradeJsonDataclass):
         data = await session._a_get(
             f"/accounts/{self.account_number}/complex-orders/live"
         )
-        return [PlacedComplexOrder(**i) for i in data["items"]]
+        return PlacedComplexOrder._validate_list(data["items"])
 
     def get_live_complex_orders(self, session: Session) -> list[PlacedComplexOrder]:
         """
@@ -1215,7 +1144,7 @@ class Account(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         """
         data = session._get(f"/accounts/{self.account_number}/complex-orders/live")
-        return [PlacedComplexOrder(**i) for i in data["items"]]
+        return PlacedComplexOrder._validate_list(data["items"])
 
     async def a_get_complex_order(
         self, session: Session, order_id: int
@@ -1359,30 +1288,9 @@ class Account(TastytradeJsonDataclass):
             "start-at": start_at,
             "end-at": end_at,
         }
-        # loop through pages and get all transactions
-        orders = []
-        while True:
-            response = await session.async_client.get(
-                f"/accounts/{self.account_number}/orders",
-                params={
-                    k: v  # type: ignore
-                    for k, v in params.items()
-                    if v is not None
-                },
-            )
-            validate_response(response)
-            json = response.json()
-            orders.extend([PlacedOrder(**i) for i in json["data"]["items"]])
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-
-        return orders
+        return await session._a_get_pages(
+            PlacedOrder, f"/accounts/{self.account_number}/orders", params, paginate
+        )
 
     def get_order_history(
         self,
@@ -1440,30 +1348,9 @@ class Account(TastytradeJsonDataclass):
             "start-at": start_at,
             "end-at": end_at,
         }
-        # loop through pages and get all transactions
-        orders = []
-        while True:
-            response = session.sync_client.get(
-                f"/accounts/{self.account_number}/orders",
-                params={
-                    k: v  # type: ignore
-                    for k, v in params.items()
-                    if v is not None
-                },
-            )
-            validate_response(response)
-            json = response.json()
-            orders.extend([PlacedOrder(**i) for i in json["data"]["items"]])
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-
-        return orders
+        return session._get_pages(
+            PlacedOrder, f"/accounts/{self.account_number}/orders", params, paginate
+        )
 
     async def a_get_complex_order_history(
         self, session: Session, per_page: int = 50, page_offset: Optional[int] = None
@@ -1483,26 +1370,12 @@ class Account(TastytradeJsonDataclass):
             page_offset = 0
             paginate = True
         params = {"per-page": per_page, "page-offset": page_offset}
-        # loop through pages and get all transactions
-        orders = []
-        while True:
-            response = await session.async_client.get(
-                f"/accounts/{self.account_number}/complex-orders",
-                params={k: v for k, v in params.items() if v is not None},
-            )
-            validate_response(response)
-            json = response.json()
-            orders.extend([PlacedComplexOrder(**i) for i in json["data"]["items"]])
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-
-        return orders
+        return await session._a_get_pages(
+            PlacedComplexOrder,
+            f"/accounts/{self.account_number}/complex-orders",
+            params,
+            paginate,
+        )
 
     def get_complex_order_history(
         self, session: Session, per_page: int = 50, page_offset: Optional[int] = None
@@ -1522,26 +1395,12 @@ class Account(TastytradeJsonDataclass):
             page_offset = 0
             paginate = True
         params = {"per-page": per_page, "page-offset": page_offset}
-        # loop through pages and get all transactions
-        orders = []
-        while True:
-            response = session.sync_client.get(
-                f"/accounts/{self.account_number}/complex-orders",
-                params={k: v for k, v in params.items() if v is not None},
-            )
-            validate_response(response)
-            json = response.json()
-            orders.extend([PlacedComplexOrder(**i) for i in json["data"]["items"]])
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-
-        return orders
+        return session._get_pages(
+            PlacedComplexOrder,
+            f"/accounts/{self.account_number}/complex-orders",
+            params,
+            paginate,
+        )
 
     async def a_place_order(
         self, session: Session, order: NewOrder, dry_run: bool = True
@@ -1686,7 +1545,7 @@ class Account(TastytradeJsonDataclass):
             )
             validate_response(response)
             chains = response.json()["data"]["items"]
-            return [OrderChain(**i) for i in chains]
+            return OrderChain._validate_list(chains)
 
     def get_order_chains(
         self,
@@ -1724,4 +1583,4 @@ class Account(TastytradeJsonDataclass):
         )
         validate_response(response)
         chains = response.json()["data"]["items"]
-        return [OrderChain(**i) for i in chains]
+        return OrderChain._validate_list(chains)
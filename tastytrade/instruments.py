@@ -1,16 +1,261 @@
+import asyncio
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+from urllib.parse import quote
 
-from pydantic import model_validator
 from typing_extensions import Self
 
 from tastytrade.order import InstrumentType, TradeableTastytradeJsonDataclass
-from tastytrade.session import Session
-from tastytrade.utils import TastytradeJsonDataclass, validate_response
+from tastytrade.session import _MAX_CONCURRENT_REQUESTS, Session, U
+from tastytrade.utils import TastytradeJsonDataclass, TTLCache, validate_response
+
+# responses for reference data that rarely changes
+_cache = TTLCache()
+# requests in progress, so concurrent callers can share them
+_inflight: dict[Hashable, "asyncio.Task[Any]"] = {}
+# pattern for converting dxfeed option symbols to OCC
+_STREAMER_RE = re.compile(r"\.([A-Z]+)(\d{6})([CP])(\d+)(\.(\d+))?")
+
+
+# a chain has only a handful of distinct expirations and strikes, so these
+# are cached rather than formatted again for every option
+
+
+@lru_cache(maxsize=4096)
+def _fmt_exp(expiration: date) -> str:
+    return f"{expiration.year % 100:02d}{expiration.month:02d}{expiration.day:02d}"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_strike(strike: Decimal) -> str:
+    if strike % 1 == 0:
+        return str(int(strike))
+    res = f"{strike:.2f}"
+    return res[:-1] if res[-1] == "0" else res
+
+
+@lru_cache(maxsize=65536)
+def _streamer_to_occ(streamer_symbol: str) -> str:
+    match = _STREAMER_RE.match(streamer_symbol)
+    if match is None:
+        return ""
+    symbol = match.group(1)[:6].ljust(6)
+    exp = match.group(2)
+    option_type = match.group(3)
+    strike = match.group(4).zfill(5)
+    if match.group(6) is not None:
+        decimal = str(100 * int(match.group(6))).zfill(3)
+    else:
+        decimal = "000"
+
+    return f"{symbol}{exp}{option_type}{strike}{decimal}"
+
+
+@lru_cache(maxsize=65536)
+def _occ_to_streamer(occ: str) -> str:
+    # the fields of an OCC symbol are fixed width, so just slice them out
+    symbol = occ[:6].split()[0]
+    exp = occ[6:12]
+    option_type = occ[12:13]
+    strike = occ[13:18]
+    decimal = occ[18:21]
+    if (
+        len(decimal) != 3
+        or option_type not in ("C", "P")
+        or not (exp + strike + decimal).isdecimal()
+    ):
+        return ""
+
+    res = f".{symbol}{exp}{option_type}{int(strike)}"
+    if decimal != "000":
+        decimal_str = str(int(decimal) / 1000.0)
+        res += decimal_str[1:]
+    return res
+
+
+# most symbols to put in a single request to a list endpoint
+_SYMBOL_BATCH_SIZE = 200
+
+
+def _symbol_batches(params: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Drops unset params and splits long symbol lists into several requests,
+    so URLs stay a reasonable length.
+    """
+    params = {k: v for k, v in params.items() if v is not None}
+    symbols = params.get("symbol[]")
+    if not symbols or len(symbols) <= _SYMBOL_BATCH_SIZE:
+        return [params]
+    return [
+        {**params, "symbol[]": symbols[i : i + _SYMBOL_BATCH_SIZE]}
+        for i in range(0, len(symbols), _SYMBOL_BATCH_SIZE)
+    ]
+
+
+T = TypeVar("T")
+
+
+async def _single_flight(key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+    """
+    Awaits `fetch`, unless a request for the same key is already in progress,
+    in which case that request's result is shared instead.
+    """
+    key = (asyncio.get_running_loop(), key)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # one caller being cancelled shouldn't cancel the request for the others
+    return await asyncio.shield(task)
+
+
+def _cache_key(base_url: Any, url: str, params: Optional[dict[str, Any]]) -> Hashable:
+    if not params:
+        return (str(base_url), url)
+    frozen = tuple(
+        sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items())
+    )
+    return (str(base_url), url, frozen)
+
+
+async def _a_get_content(
+    session: Session,
+    key: Hashable,
+    url: str,
+    params: Optional[dict[str, Any]],
+    ttl: float,
+) -> bytes:
+    if ttl <= 0:
+        response = await session.async_client.get(url, params=params, timeout=30)
+        validate_response(response)
+        return response.content
+    content = _cache.get(key)
+    if content is not None:
+        return content
+    stale = _cache.get_stale(key)
+    headers = {"If-None-Match": stale[0]} if stale else None
+    response = await session.async_client.get(
+        url, params=params, headers=headers, timeout=30
+    )
+    if stale and response.status_code == 304:
+        etag, content = stale
+    else:
+        validate_response(response)
+        content = response.content
+        etag = response.headers.get("ETag")
+    _cache.set(key, content, ttl, etag)
+    return content
+
+
+async def _a_get_revalidated(
+    session: Session,
+    url: str,
+    parse: Callable[[bytes], T],
+    ttl: float,
+    params: Optional[dict[str, Any]] = None,
+) -> T:
+    """
+    Fetches `url` and parses the response body, caching the body for `ttl`
+    seconds. Once that expires, its ETag is sent along so the body can be
+    reused if it hasn't changed. Nothing is cached if `ttl` isn't positive.
+
+    Concurrent calls for the same request share it, but only the raw body is
+    shared: every caller parses its own result, so results are never shared.
+    """
+    key = _cache_key(session.async_client.base_url, url, params)
+    content = await _single_flight(
+        key, lambda: _a_get_content(session, key, url, params, ttl)
+    )
+    return parse(content)
+
+
+def _get_content(
+    session: Session,
+    key: Hashable,
+    url: str,
+    params: Optional[dict[str, Any]],
+    ttl: float,
+) -> bytes:
+    if ttl <= 0:
+        response = session.sync_client.get(url, params=params, timeout=30)
+        validate_response(response)
+        return response.content
+    content = _cache.get(key)
+    if content is not None:
+        return content
+    stale = _cache.get_stale(key)
+    headers = {"If-None-Match": stale[0]} if stale else None
+    response = session.sync_client.get(url, params=params, headers=headers, timeout=30)
+    if stale and response.status_code == 304:
+        etag, content = stale
+    else:
+        validate_response(response)
+        content = response.content
+        etag = response.headers.get("ETag")
+    _cache.set(key, content, ttl, etag)
+    return content
+
+
+def _get_revalidated(
+    session: Session,
+    url: str,
+    parse: Callable[[bytes], T],
+    ttl: float,
+    params: Optional[dict[str, Any]] = None,
+) -> T:
+    """
+    Fetches `url` and parses the response body, caching the body for `ttl`
+    seconds. Once that expires, its ETag is sent along so the body can be
+    reused if it hasn't changed. Nothing is cached if `ttl` isn't positive.
+    """
+    key = _cache_key(session.sync_client.base_url, url, params)
+    return parse(_get_content(session, key, url, params, ttl))
+
+
+async def _a_get_items(
+    session: Session,
+    cls: type[U],
+    url: str,
+    params: dict[str, Any],
+    ttl: float = 0,
+) -> list[U]:
+    batches = _symbol_batches(params)
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+    async def get_batch(batch: dict[str, Any]) -> list[U]:
+        async with semaphore:
+            return await _a_get_revalidated(
+                session, url, cls._validate_list_json, ttl, batch
+            )
+
+    results = await asyncio.gather(*[get_batch(p) for p in batches])
+    return [item for items in results for item in items]
+
+
+def _get_items(
+    session: Session,
+    cls: type[U],
+    url: str,
+    params: dict[str, Any],
+    ttl: float = 0,
+) -> list[U]:
+    batches = _symbol_batches(params)
+
+    def get_batch(batch: dict[str, Any]) -> list[U]:
+        return _get_revalidated(session, url, cls._validate_list_json, ttl, batch)
+
+    if len(batches) == 1:
+        return get_batch(batches[0])
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+        results = executor.map(get_batch, batches)
+        return [item for items in results for item in items]
 
 
 class OptionType(str, Enum):
@@ -23,6 +268,10 @@ class OptionType(str, Enum):
     PUT = "P"
 
 
+# looking up an enum's value is several times slower than a dict lookup
+_OPTION_TYPE_CHAR = {OptionType.CALL: "C", OptionType.PUT: "P"}
+
+
 class FutureMonthCode(str, Enum):
     """
     This is an :class:`~enum.Enum` that contains the valid month codes for
@@ -201,55 +450,65 @@ class Cryptocurrency(TradeableTastytradeJsonDataclass):
 
     @classmethod
     async def a_get_cryptocurrencies(
-        cls, session: Session, symbols: list[str] = []
+        cls, session: Session, symbols: list[str] = [], ttl: float = 0
     ) -> list[Self]:
         """
         Returns a list of cryptocurrency objects from the given symbols.
 
         :param session: the session to use for the request.
         :param symbols: the symbols to get the cryptocurrencies for.
+        :param ttl:
+            how long to cache the cryptocurrencies for, in seconds; the
+            default of 0 disables caching
         """
-        params = {"symbol[]": symbols} if symbols else None
-        data = await session._a_get("/instruments/cryptocurrencies", params=params)
-        return [cls(**i) for i in data["items"]]
+        return await _a_get_items(
+            session, cls, "/instruments/cryptocurrencies", {"symbol[]": symbols}, ttl
+        )
 
     @classmethod
     def get_cryptocurrencies(
-        cls, session: Session, symbols: list[str] = []
+        cls, session: Session, symbols: list[str] = [], ttl: float = 0
     ) -> list[Self]:
         """
         Returns a list of cryptocurrency objects from the given symbols.
 
         :param session: the session to use for the request.
         :param symbols: the symbols to get the cryptocurrencies for.
+        :param ttl:
+            how long to cache the cryptocurrencies for, in seconds; the
+            default of 0 disables caching
         """
-        params = {"symbol[]": symbols} if symbols else None
-        data = session._get("/instruments/cryptocurrencies", params=params)
-        return [cls(**i) for i in data["items"]]
+        return _get_items(
+            session, cls, "/instruments/cryptocurrencies", {"symbol[]": symbols}, ttl
+        )
 
     @classmethod
     async def a_get_cryptocurrency(cls, session: Session, symbol: str) -> Self:
         """
-        Returns a Cryptocurrency object from the given symbol.
+        Returns a Cryptocurrency object from the given symbol. If you need
+        several cryptocurrencies, :meth:`a_get_cryptocurrencies` fetches them
+        in far fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the cryptocurrency for.
         """
-        symbol = symbol.replace("/", "%2F")
+        symbol = quote(symbol, safe="")
         data = await session._a_get(f"/instruments/cryptocurrencies/{symbol}")
-        return cls(**data)
+        return cls.model_validate(data)
 
     @classmethod
     def get_cryptocurrency(cls, session: Session, symbol: str) -> Self:
         """
-        Returns a Cryptocurrency object from the given symbol.
+        Returns a Cryptocurrency object from the given symbol. If you need
+        several cryptocurrencies, :meth:`get_cryptocurrencies` fetches them in
+        far fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the cryptocurrency for.
         """
-        symbol = symbol.replace("/", "%2F")
+        symbol = quote(symbol, safe="")
         data = session._get(f"/instruments/cryptocurrencies/{symbol}")
-        return cls(**data)
+        return cls.model_validate(data)
 
 
 class Equity(TradeableTastytradeJsonDataclass):
@@ -299,36 +558,17 @@ class Equity(TradeableTastytradeJsonDataclass):
             'Locate Required', 'Preborrow'
         """
         # if a specific page is provided, we just get that page;
-        # otherwise, we loop through all pages
+        # otherwise, we get all pages
         paginate = False
         if page_offset is None:
             page_offset = 0
             paginate = True
-        params = {
-            "per-page": per_page,
-            "page-offset": page_offset,
-            "lendability": lendability,
-        }
-        # loop through pages and get all active equities
-        equities = []
-        while True:
-            response = await session.async_client.get(
-                "/instruments/equities/active",
-                params={k: v for k, v in params.items() if v is not None},
-            )
-            validate_response(response)
-            json = response.json()
-            equities.extend([cls(**i) for i in json["data"]["items"]])
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-
-        return equities
+        params: dict[str, Any] = {"per-page": per_page, "page-offset": page_offset}
+        if lendability is not None:
+            params["lendability"] = lendability
+        return await session._a_get_pages(
+            cls, "/instruments/equities/active", params, paginate
+        )
 
     @classmethod
     def get_active_equities(
@@ -350,36 +590,15 @@ class Equity(TradeableTastytradeJsonDataclass):
             'Locate Required', 'Preborrow'
         """
         # if a specific page is provided, we just get that page;
-        # otherwise, we loop through all pages
+        # otherwise, we get all pages
         paginate = False
         if page_offset is None:
             page_offset = 0
             paginate = True
-        params = {
-            "per-page": per_page,
-            "page-offset": page_offset,
-            "lendability": lendability,
-        }
-        # loop through pages and get all active equities
-        equities = []
-        while True:
-            response = session.sync_client.get(
-                "/instruments/equities/active",
-                params={k: v for k, v in params.items() if v is not None},
-            )
-            validate_response(response)
-            json = response.json()
-            equities.extend([cls(**i) for i in json["data"]["items"]])
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-
-        return equities
+        params: dict[str, Any] = {"per-page": per_page, "page-offset": page_offset}
+        if lendability is not None:
+            params["lendability"] = lendability
+        return session._get_pages(cls, "/instruments/equities/active", params, paginate)
 
     @classmethod
     async def a_get_equities(
@@ -407,11 +626,7 @@ class Equity(TradeableTastytradeJsonDataclass):
             "is-index": is_index,
             "is-etf": is_etf,
         }
-        data = await session._a_get(
-            "/instruments/equities",
-            params={k: v for k, v in params.items() if v is not None},
-        )
-        return [cls(**i) for i in data["items"]]
+        return await _a_get_items(session, cls, "/instruments/equities", params)
 
     @classmethod
     def get_equities(
@@ -439,35 +654,33 @@ class Equity(TradeableTastytradeJsonDataclass):
             "is-index": is_index,
             "is-etf": is_etf,
         }
-        data = session._get(
-            "/instruments/equities",
-            params={k: v for k, v in params.items() if v is not None},
-        )
-        return [cls(**i) for i in data["items"]]
+        return _get_items(session, cls, "/instruments/equities", params)
 
     @classmethod
     async def a_get_equity(cls, session: Session, symbol: str) -> Self:
         """
-        Returns a Equity object from the given symbol.
+        Returns a Equity object from the given symbol. If you need several
+        equities, :meth:`a_get_equities` fetches them in far fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the equity for.
         """
-        symbol = symbol.replace("/", "%2F")
+        symbol = quote(symbol, safe="")
         data = await session._a_get(f"/instruments/equities/{symbol}")
-        return cls(**data)
+        return cls.model_validate(data)
 
     @classmethod
     def get_equity(cls, session: Session, symbol: str) -> Self:
         """
-        Returns a Equity object from the given symbol.
+        Returns a Equity object from the given symbol. If you need several
+        equities, :meth:`get_equities` fetches them in far fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the equity for.
         """
-        symbol = symbol.replace("/", "%2F")
+        symbol = quote(symbol, safe="")
         data = session._get(f"/instruments/equities/{symbol}")
-        return cls(**data)
+        return cls.model_validate(data)
 
 
 class Option(TradeableTastytradeJsonDataclass):
@@ -497,11 +710,9 @@ class Option(TradeableTastytradeJsonDataclass):
     halted_at: Optional[datetime] = None
     old_security_number: Optional[str] = None
 
-    @model_validator(mode="after")
-    def set_streamer_symbol(self) -> Self:
+    def model_post_init(self, __context: Any) -> None:
         if self.streamer_symbol == "":
             self._set_streamer_symbol()
-        return self
 
     @classmethod
     async def a_get_options(
@@ -520,11 +731,7 @@ class Option(TradeableTastytradeJsonDataclass):
         :param with_expired: whether to include expired options.
         """
         params = {"symbol[]": symbols, "active": active, "with-expired": with_expired}
-        data = await session._a_get(
-            "/instruments/equity-options",
-            params={k: v for k, v in params.items() if v is not None},
-        )
-        return [cls(**i) for i in data["items"]]
+        return await _a_get_items(session, cls, "/instruments/equity-options", params)
 
     @classmethod
     def get_options(
@@ -543,56 +750,63 @@ class Option(TradeableTastytradeJsonDataclass):
         :param with_expired: whether to include expired options.
         """
         params = {"symbol[]": symbols, "active": active, "with-expired": with_expired}
-        data = session._get(
-            "/instruments/equity-options",
-            params={k: v for k, v in params.items() if v is not None},
-        )
-        return [cls(**i) for i in data["items"]]
+        return _get_items(session, cls, "/instruments/equity-options", params)
 
     @classmethod
     async def a_get_option(
-        cls, session: Session, symbol: str, active: Optional[bool] = None
+        cls,
+        session: Session,
+        symbol: str,
+        active: Optional[bool] = None,
+        ttl: float = 0,
     ) -> Self:
         """
-        Returns a Option object from the given symbol.
+        Returns a Option object from the given symbol. If you need several
+        options, :meth:`a_get_options` fetches them in far fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the option for, OCC format
+        :param active: whether the option is active.
+        :param ttl:
+            how long to cache the option for, in seconds; by default it isn't
+            cached, since options carry trading state like `is_closing_only`
         """
-        symbol = symbol.replace("/", "%2F")
+        symbol = quote(symbol, safe="")
         params = {"active": active} if active is not None else None
-        data = await session._a_get(
-            f"/instruments/equity-options/{symbol}", params=params
+        url = f"/instruments/equity-options/{symbol}"
+        return await _a_get_revalidated(
+            session, url, cls._validate_data_json, ttl, params
         )
-        return cls(**data)
 
     @classmethod
     def get_option(
-        cls, session: Session, symbol: str, active: Optional[bool] = None
+        cls,
+        session: Session,
+        symbol: str,
+        active: Optional[bool] = None,
+        ttl: float = 0,
     ) -> Self:
         """
-        Returns a Option object from the given symbol.
+        Returns a Option object from the given symbol. If you need several
+        options, :meth:`get_options` fetches them in far fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the option for, OCC format
+        :param active: whether the option is active.
+        :param ttl:
+            how long to cache the option for, in seconds; by default it isn't
+            cached, since options carry trading state like `is_closing_only`
         """
-        symbol = symbol.replace("/", "%2F")
+        symbol = quote(symbol, safe="")
         params = {"active": active} if active is not None else None
-        data = session._get(f"/instruments/equity-options/{symbol}", params=params)
-        return cls(**data)
+        url = f"/instruments/equity-options/{symbol}"
+        return _get_revalidated(session, url, cls._validate_data_json, ttl, params)
 
     def _set_streamer_symbol(self) -> None:
-        if self.strike_price % 1 == 0:
-            strike = "{0:.0f}".format(self.strike_price)
-        else:
-            strike = "{0:.2f}".format(self.strike_price)
-            if strike[-1] == "0":
-                strike = strike[:-1]
-
-        exp = self.expiration_date.strftime("%y%m%d")
-        self.streamer_symbol = (
-            f".{self.underlying_symbol}{exp}{self.option_type.value}{strike}"
-        )
+        exp = _fmt_exp(self.expiration_date)
+        strike = _fmt_strike(self.strike_price)
+        option_type = _OPTION_TYPE_CHAR[self.option_type]
+        self.streamer_symbol = f".{self.underlying_symbol}{exp}{option_type}{strike}"
 
     @classmethod
     def streamer_symbol_to_occ(cls, streamer_symbol) -> str:
@@ -601,19 +815,7 @@ class Option(TradeableTastytradeJsonDataclass):
 
         :param streamer_symbol: the streamer symbol to convert
         """
-        match = re.match(r"\.([A-Z]+)(\d{6})([CP])(\d+)(\.(\d+))?", streamer_symbol)
-        if match is None:
-            return ""
-        symbol = match.group(1)[:6].ljust(6)
-        exp = match.group(2)
-        option_type = match.group(3)
-        strike = match.group(4).zfill(5)
-        if match.group(6) is not None:
-            decimal = str(100 * int(match.group(6))).zfill(3)
-        else:
-            decimal = "000"
-
-        return f"{symbol}{exp}{option_type}{strike}{decimal}"
+        return _streamer_to_occ(streamer_symbol)
 
     @classmethod
     def occ_to_streamer_symbol(cls, occ) -> str:
@@ -623,21 +825,7 @@ class Option(TradeableTastytradeJsonDataclass):
 
         :param occ: the OCC symbol to convert
         """
-        symbol = occ[:6].split()[0]
-        info = occ[6:]
-        match = re.match(r"(\d{6})([CP])(\d{5})(\d{3})", info)
-        if match is None:
-            return ""
-        exp = match.group(1)
-        option_type = match.group(2)
-        strike = int(match.group(3))
-        decimal = int(match.group(4))
-
-        res = f".{symbol}{exp}{option_type}{strike}"
-        if decimal != 0:
-            decimal_str = str(decimal / 1000.0)
-            res += decimal_str[1:]
-        return res
+        return _occ_to_streamer(occ)
 
 
 class NestedOptionChain(TastytradeJsonDataclass):
@@ -660,28 +848,33 @@ class NestedOptionChain(TastytradeJsonDataclass):
     expirations: list[NestedOptionChainExpiration]
 
     @classmethod
-    async def a_get_chain(cls, session: Session, symbol: str) -> Self:
+    async def a_get_chain(cls, session: Session, symbol: str, ttl: float = 300) -> Self:
         """
         Gets the option chain for the given symbol in nested format.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the option chain for.
+        :param ttl:
+            how long to cache the chain for, in seconds; 0 disables caching
         """
-        symbol = symbol.replace("/", "%2F")
-        data = await session._a_get(f"/option-chains/{symbol}/nested")
-        return cls(**data["items"][0])
+        symbol = quote(symbol, safe="")
+        url = f"/option-chains/{symbol}/nested"
+        chains = await _a_get_revalidated(session, url, cls._validate_list_json, ttl)
+        return chains[0]
 
     @classmethod
-    def get_chain(cls, session: Session, symbol: str) -> Self:
+    def get_chain(cls, session: Session, symbol: str, ttl: float = 300) -> Self:
         """
         Gets the option chain for the given symbol in nested format.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the option chain for.
+        :param ttl:
+            how long to cache the chain for, in seconds; 0 disables caching
         """
-        symbol = symbol.replace("/", "%2F")
-        data = session._get(f"/option-chains/{symbol}/nested")
-        return cls(**data["items"][0])
+        symbol = quote(symbol, safe="")
+        url = f"/option-chains/{symbol}/nested"
+        return _get_revalidated(session, url, cls._validate_list_json, ttl)[0]
 
 
 class FutureProduct(TastytradeJsonDataclass):
@@ -725,28 +918,36 @@ class FutureProduct(TastytradeJsonDataclass):
     option_products: Optional[list["FutureOptionProduct"]] = None
 
     @classmethod
-    async def a_get_future_products(cls, session: Session) -> list[Self]:
+    async def a_get_future_products(
+        cls, session: Session, ttl: float = 3600
+    ) -> list[Self]:
         """
         Returns a list of FutureProduct objects available.
 
         :param session: the session to use for the request.
+        :param ttl:
+            how long to cache the products for, in seconds; 0 disables caching
         """
-        data = await session._a_get("/instruments/future-products")
-        return [cls(**i) for i in data["items"]]
+        return await _a_get_revalidated(
+            session, "/instruments/future-products", cls._validate_list_json, ttl
+        )
 
     @classmethod
-    def get_future_products(cls, session: Session) -> list[Self]:
+    def get_future_products(cls, session: Session, ttl: float = 3600) -> list[Self]:
         """
         Returns a list of FutureProduct objects available.
 
         :param session: the session to use for the request.
+        :param ttl:
+            how long to cache the products for, in seconds; 0 disables caching
         """
-        data = session._get("/instruments/future-products")
-        return [cls(**i) for i in data["items"]]
+        return _get_revalidated(
+            session, "/instruments/future-products", cls._validate_list_json, ttl
+        )
 
     @classmethod
     async def a_get_future_product(
-        cls, session: Session, code: str, exchange: str = "CME"
+        cls, session: Session, code: str, exchange: str = "CME", ttl: float = 3600
     ) -> Self:
         """
         Returns a FutureProduct object from the given symbol.
@@ -755,14 +956,16 @@ class FutureProduct(TastytradeJsonDataclass):
         :param code: the product code, e.g. 'ES'
         :param exchange:
             the exchange to fetch from: 'CME', 'SMALLS', 'CFE', 'CBOED'
+        :param ttl:
+            how long to cache the product for, in seconds; 0 disables caching
         """
         code = code.replace("/", "")
-        data = await session._a_get(f"/instruments/future-products/{exchange}/{code}")
-        return cls(**data)
+        url = f"/instruments/future-products/{exchange}/{code}"
+        return await _a_get_revalidated(session, url, cls._validate_data_json, ttl)
 
     @classmethod
     def get_future_product(
-        cls, session: Session, code: str, exchange: str = "CME"
+        cls, session: Session, code: str, exchange: str = "CME", ttl: float = 3600
     ) -> Self:
         """
         Returns a FutureProduct object from the given symbol.
@@ -771,10 +974,12 @@ class FutureProduct(TastytradeJsonDataclass):
         :param code: the product code, e.g. 'ES'
         :param exchange:
             the exchange to fetch from: 'CME', 'SMALLS', 'CFE', 'CBOED'
+        :param ttl:
+            how long to cache the product for, in seconds; 0 disables caching
         """
         code = code.replace("/", "")
-        data = session._get(f"/instruments/future-products/{exchange}/{code}")
-        return cls(**data)
+        url = f"/instruments/future-products/{exchange}/{code}"
+        return _get_revalidated(session, url, cls._validate_data_json, ttl)
 
 
 class Future(TradeableTastytradeJsonDataclass):
@@ -834,11 +1039,7 @@ class Future(TradeableTastytradeJsonDataclass):
             symbols are provided.
         """
         params = {"symbol[]": symbols, "product-code[]": product_codes}
-        data = await session._a_get(
-            "/instruments/futures",
-            params={k: v for k, v in params.items() if v is not None},
-        )
-        return [cls(**i) for i in data["items"]]
+        return await _a_get_items(session, cls, "/instruments/futures", params)
 
     @classmethod
     def get_futures(
@@ -859,35 +1060,33 @@ class Future(TradeableTastytradeJsonDataclass):
             symbols are provided.
         """
         params = {"symbol[]": symbols, "product-code[]": product_codes}
-        data = session._get(
-            "/instruments/futures",
-            params={k: v for k, v in params.items() if v is not None},
-        )
-        return [cls(**i) for i in data["items"]]
+        return _get_items(session, cls, "/instruments/futures", params)
 
     @classmethod
     async def a_get_future(cls, session: Session, symbol: str) -> Self:
         """
-        Returns a Future object from the given symbol.
+        Returns a Future object from the given symbol. If you need several
+        futures, :meth:`a_get_futures` fetches them in far fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the future for.
         """
         symbol = symbol.replace("/", "")
         data = await session._a_get(f"/instruments/futures/{symbol}")
-        return cls(**data)
+        return cls.model_validate(data)
 
     @classmethod
     def get_future(cls, session: Session, symbol: str) -> Self:
         """
-        Returns a Future object from the given symbol.
+        Returns a Future object from the given symbol. If you need several
+        futures, :meth:`get_futures` fetches them in far fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the future for.
         """
         symbol = symbol.replace("/", "")
         data = session._get(f"/instruments/futures/{symbol}")
-        return cls(**data)
+        return cls.model_validate(data)
 
 
 class FutureOptionProduct(TastytradeJsonDataclass):
@@ -916,28 +1115,48 @@ class FutureOptionProduct(TastytradeJsonDataclass):
     clearport_code: Optional[str] = None
 
     @classmethod
-    async def a_get_future_option_products(cls, session: Session) -> list[Self]:
+    async def a_get_future_option_products(
+        cls, session: Session, ttl: float = 3600
+    ) -> list[Self]:
         """
         Returns a list of FutureOptionProduct objects available.
 
         :param session: the session to use for the request.
-        """
-        data = await session._a_get("/instruments/future-option-products")
-        return [cls(**i) for i in data["items"]]
+        :param ttl:
+            how long to cache the products for, in seconds; 0 disables caching
+        """
+        return await _a_get_revalidated(
+            session,
+            "/instruments/future-option-products",
+            cls._validate_list_json,
+            ttl,
+        )
 
     @classmethod
-    def get_future_option_products(cls, session: Session) -> list[Self]:
+    def get_future_option_products(
+        cls, session: Session, ttl: float = 3600
+    ) -> list[Self]:
         """
         Returns a list of FutureOptionProduct objects available.
 
         :param session: the session to use for the request.
-        """
-        data = session._get("/instruments/future-option-products")
-        return [cls(**i) for i in data["items"]]
+        :param ttl:
+            how long to cache the products for, in seconds; 0 disables caching
+        """
+        return _get_revalidated(
+            session,
+            "/instruments/future-option-products",
+            cls._validate_list_json,
+            ttl,
+        )
 
     @classmethod
     async def a_get_future_option_product(
-        cls, session: Session, root_symbol: str, exchange: str = "CME"
+        cls,
+        session: Session,
+        root_symbol: str,
+        exchange: str = "CME",
+        ttl: float = 3600,
     ) -> Self:
         """
         Returns a FutureOptionProduct object from the given symbol.
@@ -945,16 +1164,20 @@ class FutureOptionProduct(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         :param code: the root symbol of the future option
         :param exchange: the exchange to get the product from
+        :param ttl:
+            how long to cache the product for, in seconds; 0 disables caching
         """
         root_symbol = root_symbol.replace("/", "")
-        data = await session._a_get(
-            f"/instruments/future-option-products/" f"{exchange}/{root_symbol}"
-        )
-        return cls(**data)
+        url = f"/instruments/future-option-products/{exchange}/{root_symbol}"
+        return await _a_get_revalidated(session, url, cls._validate_data_json, ttl)
 
     @classmethod
     def get_future_option_product(
-        cls, session: Session, root_symbol: str, exchange: str = "CME"
+        cls,
+        session: Session,
+        root_symbol: str,
+        exchange: str = "CME",
+        ttl: float = 3600,
     ) -> Self:
         """
         Returns a FutureOptionProduct object from the given symbol.
@@ -962,12 +1185,12 @@ class FutureOptionProduct(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         :param code: the root symbol of the future option
         :param exchange: the exchange to get the product from
+        :param ttl:
+            how long to cache the product for, in seconds; 0 disables caching
         """
         root_symbol = root_symbol.replace("/", "")
-        data = session._get(
-            f"/instruments/future-option-products/" f"{exchange}/{root_symbol}"
-        )
-        return cls(**data)
+        url = f"/instruments/future-option-products/{exchange}/{root_symbol}"
+        return _get_revalidated(session, url, cls._validate_data_json, ttl)
 
 
 class FutureOption(TradeableTastytradeJsonDataclass):
@@ -1041,11 +1264,7 @@ class FutureOption(TradeableTastytradeJsonDataclass):
             "option-type": option_type.value if option_type else None,
             "strike-price": strike_price,
         }
-        data = await session._a_get(
-            "/instruments/future-options",
-            params={k: v for k, v in params.items() if v is not None},
-        )
-        return [cls(**i) for i in data["items"]]
+        return await _a_get_items(session, cls, "/instruments/future-options", params)
 
     @classmethod
     def get_future_options(
@@ -1078,35 +1297,35 @@ class FutureOption(TradeableTastytradeJsonDataclass):
             "option-type": option_type.value if option_type else None,
             "strike-price": strike_price,
         }
-        data = session._get(
-            "/instruments/future-options",
-            params={k: v for k, v in params.items() if v is not None},
-        )
-        return [cls(**i) for i in data["items"]]
+        return _get_items(session, cls, "/instruments/future-options", params)
 
     @classmethod
     async def a_get_future_option(cls, session: Session, symbol: str) -> Self:
         """
-        Returns a FutureOption object from the given symbol.
+        Returns a FutureOption object from the given symbol. If you need
+        several future options, :meth:`a_get_future_options` fetches them in
+        far fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the option for, Tastytrade format
         """
-        symbol = symbol.replace("/", "%2F").replace(" ", "%20")
+        symbol = quote(symbol, safe="")
         data = await session._a_get(f"/instruments/future-options/{symbol}")
-        return cls(**data)
+        return cls.model_validate(data)
 
     @classmethod
     def get_future_option(cls, session: Session, symbol: str) -> Self:
         """
-        Returns a FutureOption object from the given symbol.
+        Returns a FutureOption object from the given symbol. If you need
+        several future options, :meth:`get_future_options` fetches them in far
+        fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the option for, Tastytrade format
         """
-        symbol = symbol.replace("/", "%2F").replace(" ", "%20")
+        symbol = quote(symbol, safe="")
         data = session._get(f"/instruments/future-options/{symbol}")
-        return cls(**data)
+        return cls.model_validate(data)
 
 
 class NestedFutureOptionSubchain(TastytradeJsonDataclass):
@@ -1135,28 +1354,32 @@ class NestedFutureOptionChain(TastytradeJsonDataclass):
     option_chains: list[NestedFutureOptionSubchain]
 
     @classmethod
-    async def a_get_chain(cls, session: Session, symbol: str) -> Self:
+    async def a_get_chain(cls, session: Session, symbol: str, ttl: float = 60) -> Self:
         """
         Gets the futures option chain for the given symbol in nested format.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the option chain for.
+        :param ttl:
+            how long to cache the chain for, in seconds; 0 disables caching
         """
         symbol = symbol.replace("/", "")
-        data = await session._a_get(f"/futures-option-chains/{symbol}/nested")
-        return cls(**data)
+        url = f"/futures-option-chains/{symbol}/nested"
+        return await _a_get_revalidated(session, url, cls._validate_data_json, ttl)
 
     @classmethod
-    def get_chain(cls, session: Session, symbol: str) -> Self:
+    def get_chain(cls, session: Session, symbol: str, ttl: float = 60) -> Self:
         """
         Gets the futures option chain for the given symbol in nested format.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the option chain for.
+        :param ttl:
+            how long to cache the chain for, in seconds; 0 disables caching
         """
         symbol = symbol.replace("/", "")
-        data = session._get(f"/futures-option-chains/{symbol}/nested")
-        return cls(**data)
+        url = f"/futures-option-chains/{symbol}/nested"
+        return _get_revalidated(session, url, cls._validate_data_json, ttl)
 
 
 class Warrant(TastytradeJsonDataclass):
@@ -1183,9 +1406,9 @@ class Warrant(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         :param symbols: symbols of the warrants, e.g. 'NKLAW'
         """
-        params = {"symbol[]": symbols} if symbols else None
-        data = await session._a_get("/instruments/warrants", params=params)
-        return [cls(**i) for i in data["items"]]
+        return await _a_get_items(
+            session, cls, "/instruments/warrants", {"symbol[]": symbols}
+        )
 
     @classmethod
     def get_warrants(
@@ -1197,62 +1420,101 @@ class Warrant(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         :param symbols: symbols of the warrants, e.g. 'NKLAW'
         """
-        params = {"symbol[]": symbols} if symbols else None
-        data = session._get("/instruments/warrants", params=params)
-        return [cls(**i) for i in data["items"]]
+        return _get_items(session, cls, "/instruments/warrants", {"symbol[]": symbols})
 
     @classmethod
-    async def a_get_warrant(cls, session: Session, symbol: str) -> Self:
+    async def a_get_warrant(cls, session: Session, symbol: str, ttl: float = 0) -> Self:
         """
-        Returns a Warrant object from the given symbol.
+        Returns a Warrant object from the given symbol. If you need several
+        warrants, :meth:`a_get_warrants` fetches them in far fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the warrant for.
+        :param ttl:
+            how long to cache the warrant for, in seconds; by default it isn't
+            cached, since warrants carry trading state like `is_closing_only`
         """
-        data = await session._a_get(f"/instruments/warrants/{symbol}")
-        return cls(**data)
+        symbol = quote(symbol, safe="")
+        url = f"/instruments/warrants/{symbol}"
+        return await _a_get_revalidated(session, url, cls._validate_data_json, ttl)
 
     @classmethod
-    def get_warrant(cls, session: Session, symbol: str) -> Self:
+    def get_warrant(cls, session: Session, symbol: str, ttl: float = 0) -> Self:
         """
-        Returns a Warrant object from the given symbol.
+        Returns a Warrant object from the given symbol. If you need several
+        warrants, :meth:`get_warrants` fetches them in far fewer requests.
 
         :param session: the session to use for the request.
         :param symbol: the symbol to get the warrant for.
+        :param ttl:
+            how long to cache the warrant for, in seconds; by default it isn't
+            cached, since warrants carry trading state like `is_closing_only`
         """
-        data = session._get(f"/instruments/warrants/{symbol}")
-        return cls(**data)
+        symbol = quote(symbol, safe="")
+        url = f"/instruments/warrants/{symbol}"
+        return _get_revalidated(session, url, cls._validate_data_json, ttl)
 
 
 # fix pydantic forward references
 FutureProduct.model_rebuild()
 
 
+def clear_cache() -> None:
+    """
+    Forgets all cached instrument data, such as products, chains and
+    precisions, so the next request for each is fetched from the API again.
+    """
+    _cache.clear()
+
+
 async def a_get_quantity_decimal_precisions(
-    session: Session,
+    session: Session, ttl: float = 3600
 ) -> list[QuantityDecimalPrecision]:
     """
     Returns a list of QuantityDecimalPrecision objects for different
     types of instruments.
 
     :param session: the session to use for the request.
+    :param ttl:
+        how long to cache the precisions for, in seconds; 0 disables caching
     """
-    data = await session._a_get("/instruments/quantity-decimal-precisions")
-    return [QuantityDecimalPrecision(**i) for i in data["items"]]
+    return await _a_get_revalidated(
+        session,
+        "/instruments/quantity-decimal-precisions",
+        QuantityDecimalPrecision._validate_list_json,
+        ttl,
+    )
 
 
-def get_quantity_decimal_precisions(session: Session) -> list[QuantityDecimalPrecision]:
+def get_quantity_decimal_precisions(
+    session: Session, ttl: float = 3600
+) -> list[QuantityDecimalPrecision]:
     """
     Returns a list of QuantityDecimalPrecision objects for different
     types of instruments.
 
     :param session: the session to use for the request.
+    :param ttl:
+        how long to cache the precisions for, in seconds; 0 disables caching
     """
-    data = session._get("/instruments/quantity-decimal-precisions")
-    return [QuantityDecimalPrecision(**i) for i in data["items"]]
+    return _get_revalidated(
+        session,
+        "/instruments/quantity-decimal-precisions",
+        QuantityDecimalPrecision._validate_list_json,
+        ttl,
+    )
+
+
+def _parse_option_chain(content: bytes) -> dict[date, list[Option]]:
+    chain = defaultdict(list)
+    for option in Option._validate_list_json(content):
+        chain[option.expiration_date].append(option)
+    return chain
 
 
-async def a_get_option_chain(session: Session, symbol: str) -> dict[date, list[Option]]:
+async def a_get_option_chain(
+    session: Session, symbol: str, ttl: float = 0
+) -> dict[date, list[Option]]:
     """
     Returns a mapping of expiration date to a list of option objects
     representing the options chain for the given symbol.
@@ -1262,20 +1524,51 @@ async def a_get_option_chain(session: Session, symbol: str) -> dict[date, list[O
     just want one expiry, you'll need to filter the list yourself, or use
     :class:`NestedOptionChain` instead.
 
+    If a ttl is given, the raw response is cached for that long and then
+    revalidated with its ETag, so an unchanged chain isn't downloaded again.
+    Every call still builds fresh option objects from it.
+
     :param session: the session to use for the request.
     :param symbol: the symbol to get the option chain for.
+    :param ttl:
+        how long to cache the chain for, in seconds; 0 disables caching
     """
-    symbol = symbol.replace("/", "%2F")
-    data = await session._a_get(f"/option-chains/{symbol}")
-    chain = defaultdict(list)
-    for i in data["items"]:
-        option = Option(**i)
-        chain[option.expiration_date].append(option)
+    symbol = quote(symbol, safe="")
+    url = f"/option-chains/{symbol}"
+    return await _a_get_revalidated(session, url, _parse_option_chain, ttl)
 
-    return chain
 
+async def a_get_option_chains(
+    session: Session,
+    symbols: list[str],
+    concurrency: int = _MAX_CONCURRENT_REQUESTS,
+    ttl: float = 0,
+) -> dict[str, dict[date, list[Option]]]:
+    """
+    Returns a mapping of symbol to option chain for each of the given
+    symbols, fetching the chains concurrently. Each chain is the same
+    mapping of expiration date to list of option objects returned by
+    :meth:`a_get_option_chain`.
+
+    :param session: the session to use for the requests.
+    :param symbols: the symbols to get the option chains for.
+    :param concurrency: the most chains to request at once.
+    :param ttl:
+        how long to cache each chain for, in seconds; 0 disables caching
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def get_chain(symbol: str) -> dict[date, list[Option]]:
+        async with semaphore:
+            return await a_get_option_chain(session, symbol, ttl)
+
+    chains = await asyncio.gather(*[get_chain(s) for s in symbols])
+    return dict(zip(symbols, chains))
 
-def get_option_chain(session: Session, symbol: str) -> dict[date, list[Option]]:
+
+def get_option_chain(
+    session: Session, symbol: str, ttl: float = 0
+) -> dict[date, list[Option]]:
     """
     Returns a mapping of expiration date to a list of option objects
     representing the options chain for the given symbol.
@@ -1285,16 +1578,24 @@ def get_option_chain(session: Session, symbol: str) -> dict[date, list[Option]]:
     just want one expiry, you'll need to filter the list yourself, or use
     :class:`NestedOptionChain` instead.
 
+    If a ttl is given, the raw response is cached for that long and then
+    revalidated with its ETag, so an unchanged chain isn't downloaded again.
+    Every call still builds fresh option objects from it.
+
     :param session: the session to use for the request.
     :param symbol: the symbol to get the option chain for.
+    :param ttl:
+        how long to cache the chain for, in seconds; 0 disables caching
     """
-    symbol = symbol.replace("/", "%2F")
-    data = session._get(f"/option-chains/{symbol}")
+    symbol = quote(symbol, safe="")
+    url = f"/option-chains/{symbol}"
+    return _get_revalidated(session, url, _parse_option_chain, ttl)
+
+
+def _parse_future_option_chain(content: bytes) -> dict[date, list[FutureOption]]:
     chain = defaultdict(list)
-    for i in data["items"]:
-        option = Option(**i)
+    for option in FutureOption._validate_list_json(content):
         chain[option.expiration_date].append(option)
-
     return chain
 
 
@@ -1314,13 +1615,31 @@ async def a_get_future_option_chain(
     :param symbol: the symbol to get the option chain for.
     """
     symbol = symbol.replace("/", "")
-    data = await session._a_get(f"/futures-option-chains/{symbol}")
-    chain = defaultdict(list)
-    for i in data["items"]:
-        option = FutureOption(**i)
-        chain[option.expiration_date].append(option)
+    url = f"/futures-option-chains/{symbol}"
+    return await _a_get_revalidated(session, url, _parse_future_option_chain, 0)
 
-    return chain
+
+async def a_get_future_option_chains(
+    session: Session, symbols: list[str], concurrency: int = _MAX_CONCURRENT_REQUESTS
+) -> dict[str, dict[date, list[FutureOption]]]:
+    """
+    Returns a mapping of symbol to futures option chain for each of the given
+    symbols, fetching the chains concurrently. Each chain is the same
+    mapping of expiration date to list of futures option objects returned by
+    :meth:`a_get_future_option_chain`.
+
+    :param session: the session to use for the requests.
+    :param symbols: the symbols to get the option chains for.
+    :param concurrency: the most chains to request at once.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def get_chain(symbol: str) -> dict[date, list[FutureOption]]:
+        async with semaphore:
+            return await a_get_future_option_chain(session, symbol)
+
+    chains = await asyncio.gather(*[get_chain(s) for s in symbols])
+    return dict(zip(symbols, chains))
 
 
 def get_future_option_chain(
@@ -1339,10 +1658,5 @@ def get_future_option_chain(
     :param symbol: the symbol to get the option chain for.
     """
     symbol = symbol.replace("/", "")
-    data = session._get(f"/futures-option-chains/{symbol}")
-    chain = defaultdict(list)
-    for i in data["items"]:
-        option = FutureOption(**i)
-        chain[option.expiration_date].append(option)
-
-    return chain
+    url = f"/futures-option-chains/{symbol}"
+    return _get_revalidated(session, url, _parse_future_option_chain, 0)
@@ -1,6 +1,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
+from urllib.parse import quote
 
 from tastytrade.session import Session
 from tastytrade.utils import TastytradeJsonDataclass
@@ -125,7 +126,7 @@ async def a_get_market_metrics(
     data = await session._a_get(
         "/market-metrics", params={"symbols": ",".join(symbols)}
     )
-    return [MarketMetricInfo(**i) for i in data["items"]]
+    return MarketMetricInfo._validate_list(data["items"])
 
 
 def get_market_metrics(session: Session, symbols: list[str]) -> list[MarketMetricInfo]:
@@ -136,7 +137,7 @@ def get_market_metrics(session: Session, symbols: list[str]) -> list[MarketMetri
     :param symbols: list of symbols to retrieve metrics for
     """
     data = session._get("/market-metrics", params={"symbols": ",".join(symbols)})
-    return [MarketMetricInfo(**i) for i in data["items"]]
+    return MarketMetricInfo._validate_list(data["items"])
 
 
 async def a_get_dividends(session: Session, symbol: str) -> list[DividendInfo]:
@@ -146,11 +147,11 @@ async def a_get_dividends(session: Session, symbol: str) -> list[DividendInfo]:
     :param session: active user session to use
     :param symbol: symbol to retrieve dividend information for
     """
-    symbol = symbol.replace("/", "%2F")
+    symbol = quote(symbol, safe="")
     data = await session._a_get(
         f"/market-metrics/historic-corporate-events/" f"dividends/{symbol}"
     )
-    return [DividendInfo(**i) for i in data["items"]]
+    return DividendInfo._validate_list(data["items"])
 
 
 def get_dividends(session: Session, symbol: str) -> list[DividendInfo]:
@@ -160,11 +161,11 @@ def get_dividends(session: Session, symbol: str) -> list[DividendInfo]:
     :param session: active user session to use
     :param symbol: symbol to retrieve dividend information for
     """
-    symbol = symbol.replace("/", "%2F")
+    symbol = quote(symbol, safe="")
     data = session._get(
         f"/market-metrics/historic-corporate-events/" f"dividends/{symbol}"
     )
-    return [DividendInfo(**i) for i in data["items"]]
+    return DividendInfo._validate_list(data["items"])
 
 
 async def a_get_earnings(
@@ -177,13 +178,13 @@ async def a_get_earnings(
     :param symbol: symbol to retrieve earnings information for
     :param start_date: limits earnings to those on or after the given date
     """
-    symbol = symbol.replace("/", "%2F")
+    symbol = quote(symbol, safe="")
     params = {"start-date": start_date}
     data = await session._a_get(
         (f"/market-metrics/historic-corporate-events/" f"earnings-reports/{symbol}"),
         params=params,
     )
-    return [EarningsInfo(**i) for i in data["items"]]
+    return EarningsInfo._validate_list(data["items"])
 
 
 def get_earnings(session: Session, symbol: str, start_date: date) -> list[EarningsInfo]:
@@ -194,13 +195,13 @@ def get_earnings(session: Session, symbol: str, start_date: date) -> list[Earnin
     :param symbol: symbol to retrieve earnings information for
     :param start_date: limits earnings to those on or after the given date
     """
-    symbol = symbol.replace("/", "%2F")
+    symbol = quote(symbol, safe="")
     params = {"start-date": start_date}
     data = session._get(
         (f"/market-metrics/historic-corporate-events/" f"earnings-reports/{symbol}"),
         params=params,
     )
-    return [EarningsInfo(**i) for i in data["items"]]
+    return EarningsInfo._validate_list(data["items"])
 
 
 async def a_get_risk_free_rate(session: Session) -> Decimal:
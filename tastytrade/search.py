@@ -1,3 +1,5 @@
+from urllib.parse import quote
+
 from tastytrade.session import Session
 from tastytrade.utils import TastytradeJsonDataclass
 
@@ -19,14 +21,14 @@ async def a_symbol_search(session: Session, symbol: str) -> list[SymbolData]:
     :param session: active user session to use
     :param symbol: search phrase
     """
-    symbol = symbol.replace("/", "%2F")
+    symbol = quote(symbol, safe="")
     response = await session.async_client.get(f"/symbols/search/{symbol}")
     if response.status_code // 100 != 2:
         # here it doesn't really make sense to throw an exception
         return []
     else:
         data = response.json()["data"]
-        return [SymbolData(**i) for i in data["items"]]
+        return SymbolData._validate_list(data["items"])
 
 
 def symbol_search(session: Session, symbol: str) -> list[SymbolData]:
@@ -37,11 +39,11 @@ def symbol_search(session: Session, symbol: str) -> list[SymbolData]:
     :param session: active user session to use
     :param symbol: search phrase
     """
-    symbol = symbol.replace("/", "%2F")
+    symbol = quote(symbol, safe="")
     response = session.sync_client.get(f"/symbols/search/{symbol}")
     if response.status_code // 100 != 2:
         # here it doesn't really make sense to throw an exception
         return []
     else:
         data = response.json()["data"]
-        return [SymbolData(**i) for i in data["items"]]
+        return SymbolData._validate_list(data["items"])
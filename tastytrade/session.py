@@ -1,11 +1,18 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Any, Optional, Union
+from typing import Any, Optional, TypeVar, Union
 
 import httpx
 
 from tastytrade import API_URL, CERT_URL
 from tastytrade.utils import TastytradeError, TastytradeJsonDataclass, validate_response
 
+U = TypeVar("U", bound=TastytradeJsonDataclass)
+
+# most requests a single call fans out at once, whether with threads or tasks
+_MAX_CONCURRENT_REQUESTS = 8
+
 
 class Address(TastytradeJsonDataclass):
     """
@@ -349,6 +356,74 @@ class Session:
         response = self.sync_client.get(url, timeout=30, **kwargs)
         return self._validate_and_parse(response)
 
+    async def _a_get_raw(self, url, **kwargs) -> bytes:
+        response = await self.async_client.get(url, timeout=30, **kwargs)
+        validate_response(response)
+        return response.content
+
+    def _get_raw(self, url, **kwargs) -> bytes:
+        response = self.sync_client.get(url, timeout=30, **kwargs)
+        validate_response(response)
+        return response.content
+
+    async def _a_get_pages(
+        self, cls: type[U], url: str, params: dict[str, Any], paginate: bool
+    ) -> list[U]:
+        """
+        Fetches and validates the items of a paginated endpoint, starting from
+        the page offset in `params`. If `paginate` is set, the remaining pages
+        are fetched concurrently once the first one says how many there are.
+        """
+        params = {k: v for k, v in params.items() if v is not None}
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+        async def get_page(offset: int) -> tuple[list[U], Any]:
+            async with semaphore:
+                response = await self.async_client.get(
+                    url, params={**params, "page-offset": offset}
+                )
+            validate_response(response)
+            return cls._validate_page_json(response.content)
+
+        items, pagination = await get_page(params["page-offset"])
+        if paginate and pagination is not None:
+            offsets = range(pagination.page_offset + 1, pagination.total_pages)
+            pages = await asyncio.gather(*[get_page(offset) for offset in offsets])
+            for page, _ in pages:
+                items.extend(page)
+        return items
+
+    def _get_pages(
+        self, cls: type[U], url: str, params: dict[str, Any], paginate: bool
+    ) -> list[U]:
+        """
+        Fetches and validates the items of a paginated endpoint, starting from
+        the page offset in `params`. If `paginate` is set, the remaining pages
+        are fetched concurrently once the first one says how many there are.
+        """
+        params = {k: v for k, v in params.items() if v is not None}
+
+        def get_page(offset: int) -> tuple[list[U], Any]:
+            response = self.sync_client.get(
+                url, params={**params, "page-offset": offset}
+            )
+            validate_response(response)
+            return cls._validate_page_json(response.content)
+
+        items, pagination = get_page(params["page-offset"])
+        if paginate and pagination is not None:
+            offsets = range(pagination.page_offset + 1, pagination.total_pages)
+            if len(offsets) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=_MAX_CONCURRENT_REQUESTS
+                ) as executor:
+                    pages = list(executor.map(get_page, offsets))
+            else:
+                pages = [get_page(offset) for offset in offsets]
+            for page, _ in pages:
+                items.extend(page)
+        return items
+
     async def _a_delete(self, url, **kwargs) -> None:
         response = await self.async_client.delete(url, **kwargs)
         validate_response(response)
@@ -37,7 +37,7 @@ class PairsWatchlist(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         """
         data = await session._a_get("/pairs-watchlists")
-        return [cls(**i) for i in data["items"]]
+        return cls._validate_list(data["items"])
 
     @classmethod
     def get_pairs_watchlists(cls, session: Session) -> list[Self]:
@@ -47,7 +47,7 @@ class PairsWatchlist(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         """
         data = session._get("/pairs-watchlists")
-        return [cls(**i) for i in data["items"]]
+        return cls._validate_list(data["items"])
 
     @classmethod
     async def a_get_pairs_watchlist(cls, session: Session, name: str) -> Self:
@@ -96,7 +96,7 @@ class Watchlist(TastytradeJsonDataclass):
         data = await session._a_get(
             "/public-watchlists", params={"counts-only": counts_only}
         )
-        return [cls(**i) for i in data["items"]]
+        return cls._validate_list(data["items"])
 
     @classmethod
     def get_public_watchlists(
@@ -109,7 +109,7 @@ class Watchlist(TastytradeJsonDataclass):
         :param counts_only: whether to only fetch the counts of the watchlists.
         """
         data = session._get("/public-watchlists", params={"counts-only": counts_only})
-        return [cls(**i) for i in data["items"]]
+        return cls._validate_list(data["items"])
 
     @classmethod
     async def a_get_public_watchlist(cls, session: Session, name: str) -> Self:
@@ -141,7 +141,7 @@ class Watchlist(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         """
         data = await session._a_get("/watchlists")
-        return [cls(**i) for i in data["items"]]
+        return cls._validate_list(data["items"])
 
     @classmethod
     def get_private_watchlists(cls, session: Session) -> list[Self]:
@@ -151,7 +151,7 @@ class Watchlist(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         """
         data = session._get("/watchlists")
-        return [cls(**i) for i in data["items"]]
+        return cls._validate_list(data["items"])
 
     @classmethod
     async def a_get_private_watchlist(cls, session: Session, name: str) -> Self:
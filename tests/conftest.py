@@ -1,8 +1,10 @@
 import os
 
+import httpx
 from pytest import fixture
 
-from tastytrade import Session
+from tastytrade import API_URL, Session
+from tastytrade.instruments import clear_cache
 
 
 # Run all tests with asyncio only
@@ -25,3 +27,21 @@ async def session(credentials, aiolib):
     session = Session(*credentials)
     yield session
     session.destroy()
+
+
+@fixture
+def mock_session():
+    """
+    Builds sessions whose requests are answered by the given handler instead
+    of the API, for testing request logic offline.
+    """
+
+    def make(handler) -> Session:
+        clear_cache()
+        transport = httpx.MockTransport(handler)
+        session = Session.__new__(Session)
+        session.sync_client = httpx.Client(base_url=API_URL, transport=transport)
+        session.async_client = httpx.AsyncClient(base_url=API_URL, transport=transport)
+        return session
+
+    return make
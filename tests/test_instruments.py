@@ -1,3 +1,9 @@
+import asyncio
+import time
+from datetime import date
+
+import httpx
+
 from tastytrade.instruments import (
     Cryptocurrency,
     Equity,
@@ -10,8 +16,11 @@ from tastytrade.instruments import (
     Option,
     Warrant,
     a_get_future_option_chain,
+    a_get_future_option_chains,
     a_get_option_chain,
+    a_get_option_chains,
     a_get_quantity_decimal_precisions,
+    clear_cache,
     get_future_option_chain,
     get_option_chain,
     get_quantity_decimal_precisions,
@@ -150,6 +159,12 @@ async def test_get_option_chain_async(session):
         break
 
 
+async def test_get_option_chains_async(session):
+    chains = await a_get_option_chains(session, ["SPY", "QQQ"])
+    assert list(chains.keys()) == ["SPY", "QQQ"]
+    assert all(chain != {} for chain in chains.values())
+
+
 def test_get_option_chain(session):
     chain = get_option_chain(session, "SPY")
     assert chain != {}
@@ -168,6 +183,12 @@ async def test_get_future_option_chain_async(session):
         break
 
 
+async def test_get_future_option_chains_async(session):
+    chains = await a_get_future_option_chains(session, ["ES", "GC"])
+    assert list(chains.keys()) == ["ES", "GC"]
+    assert all(chain != {} for chain in chains.values())
+
+
 def test_get_future_option_chain(session):
     chain = get_future_option_chain(session, "ES")
     assert chain != {}
@@ -188,3 +209,459 @@ def test_occ_to_streamer_symbol():
     dxf = ".SPY240324P480.5"
     occ = "SPY   240324P00480500"
     assert Option.occ_to_streamer_symbol(occ) == dxf
+
+
+def test_occ_to_streamer_symbol_malformed():
+    assert Option.occ_to_streamer_symbol("SPY   240324X00480500") == ""
+    assert Option.occ_to_streamer_symbol("SPY   2403²4P00480500") == ""
+
+
+PRECISIONS = {
+    "data": {
+        "items": [
+            {
+                "instrument-type": "Equity",
+                "value": 0,
+                "minimum-increment-precision": 2,
+            }
+        ]
+    }
+}
+
+
+def test_revalidate_with_etag(mock_session, monkeypatch):
+    etags = []
+
+    def handler(request):
+        etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=PRECISIONS, headers={"ETag": '"v1"'})
+
+    session = mock_session(handler)
+    first = get_quantity_decimal_precisions(session)
+    assert get_quantity_decimal_precisions(session) == first
+    assert etags == [None]
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 3601)
+    assert get_quantity_decimal_precisions(session) == first
+    assert etags == [None, '"v1"']
+
+
+def test_ttl_zero_skips_cache(mock_session):
+    etags = []
+
+    def handler(request):
+        etags.append(request.headers.get("If-None-Match"))
+        return httpx.Response(200, json=PRECISIONS, headers={"ETag": '"v1"'})
+
+    session = mock_session(handler)
+    get_quantity_decimal_precisions(session, ttl=0)
+    get_quantity_decimal_precisions(session, ttl=0)
+    assert etags == [None, None]
+
+
+def test_cached_results_are_not_shared(mock_session):
+    session = mock_session(lambda _: httpx.Response(200, json=PRECISIONS))
+    first = get_quantity_decimal_precisions(session)
+    second = get_quantity_decimal_precisions(session)
+    assert first == second
+    assert first is not second and first[0] is not second[0]
+
+
+def counting_handler(body):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=body)
+
+    return requests, handler
+
+
+NESTED_CHAIN = {
+    "underlying-symbol": "SPY",
+    "root-symbol": "SPY",
+    "option-chain-type": "Standard",
+    "shares-per-contract": 100,
+    "tick-sizes": [],
+    "deliverables": [],
+    "expirations": [],
+}
+FUTURE_PRODUCT = {
+    "root-symbol": "/ES",
+    "code": "ES",
+    "description": "E-Mini S&P 500",
+    "exchange": "CME",
+    "product-type": "Financial",
+    "listed-months": ["H", "M", "U", "Z"],
+    "active-months": ["H", "M"],
+    "notional-multiplier": "50.0",
+    "tick-size": "0.25",
+    "display-factor": "0.01",
+    "streamer-exchange-code": "XCME",
+    "small-notional": False,
+    "back-month-first-calendar-symbol": True,
+    "first-notice": False,
+    "cash-settled": True,
+    "market-sector": "Equity Index",
+    "clearing-code": "ES",
+    "clearing-exchange-code": "16",
+    "roll": {
+        "name": "equity_index",
+        "active-count": 2,
+        "cash-settled": True,
+        "business-days-offset": 4,
+        "first-notice": False,
+    },
+}
+
+
+def test_nested_option_chain_cache(mock_session):
+    requests, handler = counting_handler({"data": {"items": [NESTED_CHAIN]}})
+    session = mock_session(handler)
+    first = NestedOptionChain.get_chain(session, "SPY")
+    second = NestedOptionChain.get_chain(session, "SPY")
+    assert len(requests) == 1
+    assert first == second and first is not second
+    NestedOptionChain.get_chain(session, "SPY", ttl=0)
+    NestedOptionChain.get_chain(session, "SPY", ttl=0)
+    assert len(requests) == 3
+
+
+async def test_nested_option_chain_single_flight(mock_session):
+    requests, handler = counting_handler({"data": {"items": [NESTED_CHAIN]}})
+    session = mock_session(handler)
+    chains = await asyncio.gather(
+        *[NestedOptionChain.a_get_chain(session, "SPY") for _ in range(5)]
+    )
+    assert len(requests) == 1
+    assert len({id(chain) for chain in chains}) == 5
+
+
+def test_future_product_cache(mock_session):
+    requests, handler = counting_handler({"data": FUTURE_PRODUCT})
+    session = mock_session(handler)
+    first = FutureProduct.get_future_product(session, "ES")
+    second = FutureProduct.get_future_product(session, "ES")
+    assert len(requests) == 1
+    assert first == second and first is not second
+    FutureProduct.get_future_product(session, "ES", ttl=0)
+    FutureProduct.get_future_product(session, "ES", ttl=0)
+    assert len(requests) == 3
+
+
+async def test_future_products_cache_async(mock_session):
+    requests, handler = counting_handler({"data": {"items": [FUTURE_PRODUCT]}})
+    session = mock_session(handler)
+    first = await FutureProduct.a_get_future_products(session)
+    second = await FutureProduct.a_get_future_products(session)
+    assert len(requests) == 1
+    assert first == second and first[0] is not second[0]
+    await FutureProduct.a_get_future_products(session, ttl=0)
+    assert len(requests) == 2
+
+
+FUTURE_OPTION_PRODUCT = {
+    "root-symbol": "ES",
+    "cash-settled": False,
+    "code": "ES",
+    "display-factor": "0.01",
+    "exchange": "CME",
+    "product-type": "Physical",
+    "expiration-type": "Regular",
+    "settlement-delay-days": 0,
+    "market-sector": "Equity Index",
+    "clearing-code": "ES",
+    "clearing-exchange-code": "16",
+    "clearing-price-multiplier": "1.0",
+    "is-rollover": False,
+}
+
+
+def test_future_option_product_cache(mock_session):
+    requests, handler = counting_handler({"data": FUTURE_OPTION_PRODUCT})
+    session = mock_session(handler)
+    first = FutureOptionProduct.get_future_option_product(session, "ES")
+    second = FutureOptionProduct.get_future_option_product(session, "ES")
+    assert len(requests) == 1
+    assert first == second and first is not second
+    FutureOptionProduct.get_future_option_product(session, "ES", ttl=0)
+    assert len(requests) == 2
+
+
+async def test_future_option_product_single_flight(mock_session):
+    requests, handler = counting_handler({"data": FUTURE_OPTION_PRODUCT})
+    session = mock_session(handler)
+    products = await asyncio.gather(
+        *[
+            FutureOptionProduct.a_get_future_option_product(session, "ES")
+            for _ in range(5)
+        ]
+    )
+    assert len(requests) == 1
+    assert len({id(product) for product in products}) == 5
+
+
+NESTED_FUTURE_OPTION_CHAIN = {"futures": [], "option-chains": []}
+
+
+def test_nested_future_option_chain_cache(mock_session):
+    requests, handler = counting_handler({"data": NESTED_FUTURE_OPTION_CHAIN})
+    session = mock_session(handler)
+    first = NestedFutureOptionChain.get_chain(session, "/ES")
+    second = NestedFutureOptionChain.get_chain(session, "/ES")
+    assert len(requests) == 1
+    assert first == second and first is not second
+    NestedFutureOptionChain.get_chain(session, "/ES", ttl=0)
+    assert len(requests) == 2
+
+
+async def test_nested_future_option_chain_single_flight(mock_session):
+    requests, handler = counting_handler({"data": NESTED_FUTURE_OPTION_CHAIN})
+    session = mock_session(handler)
+    chains = await asyncio.gather(
+        *[NestedFutureOptionChain.a_get_chain(session, "/ES") for _ in range(5)]
+    )
+    assert len(requests) == 1
+    assert len({id(chain) for chain in chains}) == 5
+
+
+WARRANT = {
+    "symbol": "NKLAW",
+    "instrument-type": "Warrant",
+    "listed-market": "XNAS",
+    "description": "Nikola Corp Warrant",
+    "is-closing-only": False,
+    "active": True,
+}
+
+
+def test_get_warrant_not_cached_by_default(mock_session):
+    requests, handler = counting_handler({"data": WARRANT})
+    session = mock_session(handler)
+    Warrant.get_warrant(session, "NKLAW")
+    Warrant.get_warrant(session, "NKLAW")
+    assert len(requests) == 2
+    first = Warrant.get_warrant(session, "NKLAW", ttl=60)
+    second = Warrant.get_warrant(session, "NKLAW", ttl=60)
+    assert len(requests) == 3
+    assert first == second and first is not second
+
+
+async def test_get_warrant_not_cached_by_default_async(mock_session):
+    requests, handler = counting_handler({"data": WARRANT})
+    session = mock_session(handler)
+    await Warrant.a_get_warrant(session, "NKLAW")
+    await Warrant.a_get_warrant(session, "NKLAW")
+    assert len(requests) == 2
+    first = await Warrant.a_get_warrant(session, "NKLAW", ttl=60)
+    second = await Warrant.a_get_warrant(session, "NKLAW", ttl=60)
+    assert len(requests) == 3
+    assert first == second and first is not second
+
+
+CRYPTOCURRENCY = {
+    "id": 1,
+    "symbol": "BTC/USD",
+    "instrument-type": "Cryptocurrency",
+    "short-description": "Bitcoin",
+    "description": "Bitcoin to USD",
+    "is-closing-only": False,
+    "active": True,
+    "tick-size": "0.01",
+    "destination-venue-symbols": [],
+}
+
+
+def test_get_cryptocurrencies_not_cached_by_default(mock_session):
+    requests, handler = counting_handler({"data": {"items": [CRYPTOCURRENCY]}})
+    session = mock_session(handler)
+    Cryptocurrency.get_cryptocurrencies(session, ["BTC/USD"])
+    Cryptocurrency.get_cryptocurrencies(session, ["BTC/USD"])
+    assert len(requests) == 2
+
+
+def test_cached_cryptocurrencies_are_not_shared(mock_session):
+    requests, handler = counting_handler({"data": {"items": [CRYPTOCURRENCY]}})
+    session = mock_session(handler)
+    first = Cryptocurrency.get_cryptocurrencies(session, ["BTC/USD"], ttl=60)
+    first[0].active = False
+    first.clear()
+    second = Cryptocurrency.get_cryptocurrencies(session, ["BTC/USD"], ttl=60)
+    assert len(requests) == 1
+    assert len(second) == 1 and second[0].active
+
+
+async def test_cached_cryptocurrencies_are_not_shared_async(mock_session):
+    requests, handler = counting_handler({"data": {"items": [CRYPTOCURRENCY]}})
+    session = mock_session(handler)
+    results = await asyncio.gather(
+        *[
+            Cryptocurrency.a_get_cryptocurrencies(session, ["BTC/USD"], ttl=60)
+            for _ in range(3)
+        ]
+    )
+    assert len(requests) == 1
+    assert len({id(result[0]) for result in results}) == 3
+
+
+def option_item(expiration: str, strike: int) -> dict:
+    exp = expiration.replace("-", "")[2:]
+    return {
+        "symbol": f"SPY   {exp}C{strike * 1000:08d}",
+        "instrument-type": "Equity Option",
+        "active": True,
+        "strike-price": str(strike),
+        "root-symbol": "SPY",
+        "underlying-symbol": "SPY",
+        "expiration-date": expiration,
+        "exercise-style": "American",
+        "shares-per-contract": 100,
+        "option-type": "C",
+        "option-chain-type": "Standard",
+        "expiration-type": "Regular",
+        "settlement-type": "PM",
+        "stops-trading-at": "2025-01-17T21:00:00.000+00:00",
+        "market-time-instrument-collection": "Equity Option",
+        "days-to-expiration": 30,
+        "expires-at": "2025-01-17T21:00:00.000+00:00",
+        "is-closing-only": False,
+    }
+
+
+CHAIN = {
+    "data": {
+        "items": [
+            option_item("2025-01-17", 400),
+            option_item("2025-01-17", 401),
+            option_item("2025-01-24", 400),
+        ]
+    }
+}
+FUTURE_OPTION = {
+    "symbol": "./ESZ5 E1AX5 251103C6000",
+    "underlying-symbol": "/ESZ5",
+    "product-code": "ES",
+    "expiration-date": "2025-11-03",
+    "root-symbol": "/ES",
+    "option-root-symbol": "E1A",
+    "strike-price": "6000.0",
+    "exchange": "CME",
+    "streamer-symbol": "./E1AX25C6000:XCME",
+    "option-type": "C",
+    "exercise-style": "American",
+    "is-vanilla": True,
+    "is-primary-deliverable": True,
+    "future-price-ratio": "1.0",
+    "multiplier": "50.0",
+    "underlying-count": "1.0",
+    "is-confirmed": True,
+    "notional-value": "0.5",
+    "display-factor": "0.01",
+    "settlement-type": "Future",
+    "strike-factor": "1.0",
+    "maturity-date": "2025-11-03",
+    "is-exercisable-weekly": True,
+    "last-trade-time": "0",
+    "days-to-expiration": 17,
+    "is-closing-only": False,
+    "active": True,
+    "stops-trading-at": "2025-11-03T21:00:00.000+00:00",
+    "expires-at": "2025-11-03T21:00:00.000+00:00",
+    "exchange-symbol": "E1AX5 C6000",
+    "security-exchange": "XCME",
+    "sx-id": "0",
+}
+
+
+def delayed_handler(body):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=body)
+
+    return requests, handler
+
+
+async def test_option_chain_single_flight(mock_session):
+    requests, handler = delayed_handler(CHAIN)
+    session = mock_session(handler)
+    chains = await asyncio.gather(
+        *[a_get_option_chain(session, "SPY") for _ in range(5)]
+    )
+    assert len(requests) == 1
+    assert all(len(chain) == 2 for chain in chains)
+    # each caller still gets its own chain to change
+    assert len({id(chain) for chain in chains}) == 5
+
+
+async def test_future_option_chain_single_flight(mock_session):
+    requests, handler = delayed_handler({"data": {"items": [FUTURE_OPTION]}})
+    session = mock_session(handler)
+    chains = await asyncio.gather(
+        *[a_get_future_option_chain(session, "/ES") for _ in range(5)]
+    )
+    assert len(requests) == 1
+    assert all(len(chain) == 1 for chain in chains)
+    assert len({id(chain) for chain in chains}) == 5
+
+
+def test_get_option_not_cached_by_default(mock_session):
+    requests, handler = counting_handler({"data": option_item("2025-01-17", 400)})
+    session = mock_session(handler)
+    symbol = "SPY   250117C00400000"
+    Option.get_option(session, symbol)
+    Option.get_option(session, symbol)
+    assert len(requests) == 2
+    first = Option.get_option(session, symbol, ttl=60)
+    second = Option.get_option(session, symbol, ttl=60)
+    assert len(requests) == 3
+    assert first == second and first is not second
+    Option.get_option(session, symbol, active=True, ttl=60)
+    assert len(requests) == 4
+
+
+def test_cached_option_chain_is_rebuilt(mock_session):
+    requests, handler = counting_handler(CHAIN)
+    session = mock_session(handler)
+    chain = get_option_chain(session, "SPY", ttl=60)
+    assert [len(options) for options in chain.values()] == [2, 1]
+    chain[date(2025, 1, 17)].clear()
+    chain[date(2025, 2, 21)]
+    chain = get_option_chain(session, "SPY", ttl=60)
+    assert [len(options) for options in chain.values()] == [2, 1]
+    assert len(requests) == 1
+
+
+def warrant_handler(request):
+    symbols = request.url.params.get_list("symbol[]")
+    assert len(symbols) <= 200
+    items = [{**WARRANT, "symbol": symbol, "description": symbol} for symbol in symbols]
+    return httpx.Response(200, json={"data": {"items": items}})
+
+
+def test_get_warrants_batched(mock_session):
+    session = mock_session(warrant_handler)
+    symbols = [f"W{i}" for i in range(450)]
+    warrants = Warrant.get_warrants(session, symbols)
+    assert [w.symbol for w in warrants] == symbols
+
+
+async def test_get_warrants_batched_async(mock_session):
+    session = mock_session(warrant_handler)
+    symbols = [f"W{i}" for i in range(450)]
+    warrants = await Warrant.a_get_warrants(session, symbols)
+    assert [w.symbol for w in warrants] == symbols
+
+
+def test_clear_cache(mock_session):
+    requests, handler = counting_handler(PRECISIONS)
+    session = mock_session(handler)
+    get_quantity_decimal_precisions(session)
+    get_quantity_decimal_precisions(session)
+    clear_cache()
+    get_quantity_decimal_precisions(session)
+    assert len(requests) == 2
@@ -1,4 +1,7 @@
+import httpx
+
 from tastytrade import Session
+from tastytrade.utils import TastytradeJsonDataclass
 
 
 def test_get_customer(session):
@@ -25,3 +28,37 @@ def test_destroy(credentials):
 async def test_destroy_async(credentials):
     session = Session(*credentials)
     await session.a_destroy()
+
+
+class Item(TastytradeJsonDataclass):
+    id: int
+
+
+def pages_handler(request):
+    assert "unset" not in request.url.params
+    offset = int(request.url.params["page-offset"])
+    return httpx.Response(
+        200,
+        json={
+            "data": {"items": [{"id": offset * 2}, {"id": offset * 2 + 1}]},
+            "pagination": {"page-offset": offset, "total-pages": 5},
+        },
+    )
+
+
+def test_get_pages(mock_session):
+    session = mock_session(pages_handler)
+    params = {"page-offset": 0, "per-page": 2, "unset": None}
+    items = session._get_pages(Item, "/items", params, True)
+    assert [item.id for item in items] == list(range(10))
+    items = session._get_pages(Item, "/items", {"page-offset": 3}, False)
+    assert [item.id for item in items] == [6, 7]
+
+
+async def test_get_pages_async(mock_session):
+    session = mock_session(pages_handler)
+    params = {"page-offset": 0, "per-page": 2, "unset": None}
+    items = await session._a_get_pages(Item, "/items", params, True)
+    assert [item.id for item in items] == list(range(10))
+    items = await session._a_get_pages(Item, "/items", {"page-offset": 3}, False)
+    assert [item.id for item in items] == [6, 7]
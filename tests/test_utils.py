@@ -1,6 +1,8 @@
+import time
 from datetime import date
 
 from tastytrade.utils import (
+    TTLCache,
     get_future_fx_monthly,
     get_future_grain_monthly,
     get_future_index_monthly,
@@ -158,3 +160,34 @@ def test_get_future_index_monthly():
     ]
     for exp in exps:
         assert get_future_index_monthly(exp) == exp
+
+
+def test_ttl_cache():
+    cache = TTLCache()
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=0)
+    cache.set("c", 3, ttl=-1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") is None
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_expiry(monkeypatch):
+    cache = TTLCache()
+    cache.set("a", 1, ttl=60)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_maxsize():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3, ttl=60)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3